@@ -11,21 +11,112 @@ Usage:
 Requirements:
     Standard library only for basic features
     Optional: pip install pyttsx3 (for text-to-speech)
+    Optional: pip install orjson (faster loading/saving of large histories)
 """
 
 import time # For countdown timer and sleep()
+import atexit # To write out any buffered sessions when the program exits
+import collections # For per-day session counts
+import bisect # For binary-searching sessions by date
+import itertools # For lazily slicing recent history
 import json # To save/load session data to file
+import os # To set aside a corrupted data file
 import sys # To read command-line arguments (sys.argv)
 from datetime import datetime # To track dates and times
-import os # To check for file existence
 import platform # To detect operating system for sound compatibility
+import signal # For the kernel interval timer that drives the countdown (POSIX)
+import threading # Signals can only be waited on from the main thread
+import importlib.util # To check for optional packages without importing them
+from functools import lru_cache # To create the TTS engine only once per process
 
-# Try to import text-to-speech (optional)
+# Date/time formats for session records
+_DATE_FMT = '%Y-%m-%d'  # YYYY-MM-DD
+_TIME_FMT = '%H:%M:%S'  # HH:MM:SS
+
+# Streak bars for the stats view: bars up to 31 tomatoes are built once and reused
+_TOMATO = "🍅"
+_BAR_CACHE = [_TOMATO * i for i in range(32)]
+
+# Interval timers and sigwait() are POSIX-only; Windows sleeps between ticks instead
+_HAS_ITIMER = all(hasattr(signal, name) for name in ('setitimer', 'pthread_sigmask', 'sigtimedwait', 'sigwait', 'sigpending'))
+
+# Countdown display line, formatted once per tick with MM:SS leading zeros
+_TIMER_LINE = "\r⏱️  %02d:%02d remaining"
+
+# Use orjson for faster session encoding/decoding if installed (optional)
 try:
-    import pyttsx3
-    TTS_AVAILABLE = True
+    import orjson
+    
+    def _dumps_line(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE) # bytes, one JSON Lines record
+    
+    _loads = orjson.loads
 except ImportError:
-    TTS_AVAILABLE = False
+    def _dumps_line(obj):
+        return (json.dumps(obj) + "\n").encode('utf-8') # bytes, one JSON Lines record
+    
+    _loads = json.loads # accepts bytes as well as str
+
+def _is_valid_session(record):
+    """Check that a loaded record has the fields the stats and history views rely on"""
+    return (isinstance(record, dict)
+            and all(key in record for key in ('task', 'date', 'time', 'duration'))
+            and isinstance(record['date'], str) # compared and sorted as YYYY-MM-DD text
+            and isinstance(record['duration'], (int, float))) # summed into focus time
+
+# Check for text-to-speech (optional) without importing it - pyttsx3 is only
+# imported when a TTS announcement actually plays, so stats/today/history start fast
+TTS_AVAILABLE = importlib.util.find_spec('pyttsx3') is not None
+
+@lru_cache(maxsize=None)
+def _get_tts():
+    """Create and configure the text-to-speech engine, or None if pyttsx3 won't import (cached after first call)"""
+    try:
+        import pyttsx3 # imported lazily, only needed once a TTS sound plays
+    except ImportError:
+        return None # installed but broken - returned (not raised) so lru_cache remembers it
+    engine = pyttsx3.init()
+    # Adjust speech rate for better clarity (default is ~200)
+    engine.setProperty('rate', 150)
+    return engine
+
+class SessionStore:
+    """Session records kept in date order, with a parallel list of dates for fast lookups"""
+    def __init__(self):
+        self.dates = []    # session dates (YYYY-MM-DD sorts correctly as text), always sorted
+        self.records = []  # session dicts, same order as self.dates
+    
+    def add(self, session):
+        """Add a session, keeping records sorted by date"""
+        date = session['date']
+        if not self.dates or date >= self.dates[-1]:
+            # Usual case: sessions arrive in chronological order, so just append
+            self.dates.append(date)
+            self.records.append(session)
+        else:
+            # Out-of-order date (e.g. the system clock was changed): insert in place
+            i = bisect.bisect_right(self.dates, date)
+            self.dates.insert(i, date)
+            self.records.insert(i, session)
+    
+    def between(self, start, end):
+        """Return sessions dated from start to end (inclusive) using binary search"""
+        lo = bisect.bisect_left(self.dates, start)
+        hi = bisect.bisect_right(self.dates, end)
+        return self.records[lo:hi]
+    
+    def on_date(self, date):
+        """Return sessions from a single date"""
+        return self.between(date, date)
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records)
+    
+    def __reversed__(self):
+        return reversed(self.records)
 
 class PomodoroTimer:
     # Initialize the Pomodoro timer
@@ -33,24 +124,133 @@ class PomodoroTimer:
         self.data_file = data_file
         self.work_duration = 25 * 60  # 25 minutes in seconds (easier for time.sleep())
         self.break_duration = 5 * 60   # 5 minutes in seconds
-        self.sessions = self.load_sessions()
+        self.batch_size = 1  # completed sessions to buffer before writing (1 = write each one right away)
+        self._pending = []  # completed sessions not yet written to the data file
+        self._needs_newline = False  # True if the data file's last line is missing its newline
+        self._needs_migration = False  # True if the data file is still in the old format and must be rewritten
+        atexit.register(self.flush_sessions)  # never lose buffered sessions on exit
+        self.sessions = SessionStore()  # all sessions, sorted by date
+        self._days = collections.Counter()  # date -> number of sessions, kept up to date incrementally
+        self._total_minutes = 0  # total focus minutes across all sessions, kept up to date incrementally
+        for session in self.load_sessions():
+            self._add_session(session)
         self.sound_mode = None  # User's sound preference (set on first start)
-        self.tts_engine = None  # Text-to-speech engine instance (initialized if needed)
     
     def load_sessions(self):
-        # Use existing data file or create new
-        if os.path.exists(self.data_file): # Does file exist?
+        # Use existing data file or create new - just try to open it rather than
+        # checking whether it exists first (one less syscall, no race)
+        try:
+            with open(self.data_file, 'rb') as f: # binary: orjson and json both parse UTF-8 bytes directly
+                first = f.read(1)
+                while first.isspace(): # the old json.load() format allowed leading whitespace
+                    first = f.read(1)
+                legacy = first == b'[' # Old format: one JSON array rewritten on every save
+                f.seek(0)
+                skipped = 0
+                if legacy:
+                    try:
+                        records = _loads(f.read())
+                    except ValueError:
+                        records = None # damaged old-format file, handled below
+                    if isinstance(records, list):
+                        sessions = [record for record in records if _is_valid_session(record)]
+                        skipped = len(records) - len(sessions)
+                    else:
+                        sessions = None
+                else:
+                    sessions = []
+                    line = b''
+                    for line in f: # JSON Lines: one session record per line, parsed as we stream
+                        if not line.strip(): # skip blank lines
+                            continue
+                        try:
+                            record = _loads(line)
+                        except ValueError:
+                            record = None # damaged record (e.g. cut off mid-write)
+                        if _is_valid_session(record):
+                            sessions.append(record)
+                        else:
+                            skipped += 1 # skip damaged or incomplete records, keep the rest
+                    # A cut-off last line has no newline; remember to end it before appending
+                    self._needs_newline = bool(line) and not line.endswith(b'\n')
+                if skipped:
+                    print(f"⚠️  Skipped {skipped} unreadable record(s) in {self.data_file}")
+        except FileNotFoundError:
+            return [] # No file yet, start with an empty list (to make sure that program does not crash)
+        if legacy:
+            if sessions is None:
+                # Can't recover records from a broken array - set it aside and start fresh,
+                # so new sessions aren't appended onto it
+                backup = self.data_file + '.bak'
+                try:
+                    os.replace(self.data_file, backup)
+                    print(f"⚠️  {self.data_file} is corrupted, moved it to {backup} and started fresh")
+                except OSError:
+                    print(f"⚠️  {self.data_file} is corrupted and couldn't be moved aside, starting fresh")
+                    self._needs_migration = True # replace it (not append to it) on the next save
+                return []
+            if not self._migrate_sessions(sessions): # one-time rewrite as JSON Lines
+                print(f"⚠️  Couldn't convert {self.data_file} to the new format, will retry on the next save")
+                self._needs_migration = True
+        return sessions
+    
+    def _migrate_sessions(self, sessions):
+        """Rewrite an old JSON array data file as JSON Lines"""
+        # Write to a temp file and swap it in, so the original is never left half-written
+        temp_file = self.data_file + '.tmp'
+        try:
+            with open(temp_file, 'wb') as f:
+                f.writelines(_dumps_line(session) for session in sessions)
+            os.replace(temp_file, self.data_file)
+        except OSError:
+            # Read-only or full disk: keep the old file and the sessions already loaded
+            # (new sessions can't be appended to an array file, so try again next time)
             try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f) # Read JSON from file
-            except:
-                return [] # If file is corrupted, start fresh
-        return [] # No file yet, start with an empty list (to make sure that program does not crash)
+                os.remove(temp_file)
+            except OSError:
+                pass
+            return False
+        return True
+    
+    def _add_session(self, session):
+        """Add a session to the in-memory history and counts"""
+        # Dates and task names repeat across many sessions - intern them so every record
+        # shares one string object (less memory, faster date lookups and comparisons)
+        for key in ('date', 'task'):
+            if type(session.get(key)) is str: # a hand-edited file might hold null or a number
+                session[key] = sys.intern(session[key])
+        self.sessions.add(session)
+        self._days[session['date']] += 1 # Count sessions per day
+        self._total_minutes += session['duration']
     
-    def save_sessions(self):
-        """Save session history to file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.sessions, f, indent=2) # indent for readability, called after each pomodoro completion
+    def save_sessions(self, new_session):
+        """Queue a completed session and write it once the batch is full"""
+        self._pending.append(new_session)
+        if len(self._pending) >= self.batch_size:
+            self.flush_sessions()
+    
+    def flush_sessions(self):
+        """Append all queued sessions to the data file"""
+        if not self._pending:
+            return
+        if self._needs_migration:
+            # Old-format file couldn't be converted at load time - appending would mix formats,
+            # so rewrite the whole history (which already includes the queued sessions) instead
+            if not self._migrate_sessions(list(self.sessions)):
+                print(f"⚠️  Couldn't save to {self.data_file} - check that its folder is writable")
+                return
+            self._pending.clear()
+            self._needs_migration = False
+            return
+        # Append-only: write just the new records instead of rewriting the whole history,
+        # joined into one bytes object so the batch goes out in a single write
+        data = b''.join(_dumps_line(session) for session in self._pending)
+        if self._needs_newline:
+            data = b'\n' + data # don't let the new record run into a cut-off last line
+        with open(self.data_file, 'ab') as f:
+            f.write(data)
+        self._pending.clear()
+        self._needs_newline = False
     
     def play_sound(self, sound_type):
         """Play sound based on user preference and event type"""
@@ -76,29 +276,30 @@ class PomodoroTimer:
             elif sound_type == 'break_end':
                 winsound.Beep(600, 400)  # Lower tone for break end
         else:
-            # Mac/Linux - use system bell (terminal beep)
+            # Mac/Linux - use system bell (terminal beep), written straight to the terminal
             if sound_type == 'start':
-                os.system('echo -e "\\a"')  # Single beep
+                self._bell()  # Single beep
             elif sound_type == 'complete':
                 for _ in range(3):
-                    os.system('echo -e "\\a"')
+                    self._bell()
                     time.sleep(0.2)
             elif sound_type == 'break_end':
-                os.system('echo -e "\\a"')
+                self._bell()
+    
+    def _bell(self):
+        """Ring the terminal bell"""
+        sys.stdout.write('\a')
+        sys.stdout.flush()
     
     def _play_tts(self, sound_type):
         """Play text-to-speech announcements"""
-        if not TTS_AVAILABLE:
+        # Engine is initialized on first use, then reused; None if pyttsx3 is missing or won't import
+        engine = _get_tts() if TTS_AVAILABLE else None
+        if engine is None:
             print("⚠️  TTS not available, falling back to beeps")
             self._play_beep(sound_type)
             return
         
-        # Initialize TTS engine on first use
-        if self.tts_engine is None:
-            self.tts_engine = pyttsx3.init()
-            # Adjust speech rate for better clarity (default is ~200)
-            self.tts_engine.setProperty('rate', 150)
-        
         # Different messages for different events
         messages = {
             'start': 'Pomodoro session starting. Stay focused!',
@@ -108,8 +309,8 @@ class PomodoroTimer:
         
         message = messages.get(sound_type, '')
         if message:
-            self.tts_engine.say(message)
-            self.tts_engine.runAndWait()  # Wait for speech to finish
+            engine.say(message)
+            engine.runAndWait()  # Wait for speech to finish
     
     def choose_sound_mode(self):
         """Ask user for sound preference at start of session"""
@@ -152,22 +353,88 @@ class PomodoroTimer:
         print(f"\n🍅 {label} - {duration // 60} minutes")
         print("=" * 50)
         
-        end_time = time.time() + duration # when timer should end
+        # Bind stdout methods once; writing directly skips print()'s extra work every tick
+        write = sys.stdout.write
+        flush = sys.stdout.flush
         
-        while time.time() < end_time: # keep looping until time is up
-            remaining = int(end_time - time.time()) # seconds left
-            mins, secs = divmod(remaining, 60) # convert to mins:secs format
-            
-            # Clear line and print timer
-            timer_display = f"⏱️  {mins:02d}:{secs:02d} remaining" # formatted string with leading zeros
-            print(f"\r{timer_display}", end="", flush=True)  # carriage return, moves cursor to start of line, flush and overwrites text
-            # then 'end-' makes sure it doesn't go to new line while flush updates the display immediately
-            
-            time.sleep(1) # wait a second before updating
+        # Use a kernel interval timer where available, otherwise sleep between ticks
+        if _HAS_ITIMER and threading.current_thread() is threading.main_thread():
+            ticks = self._itimer_ticks(duration)
+        else:
+            ticks = self._sleep_ticks(duration)
+        
+        try:
+            for remaining in ticks: # one value per second: seconds left
+                mins, secs = divmod(remaining, 60) # convert to mins:secs format
+                
+                # Clear line and print timer
+                write(_TIMER_LINE % (mins, secs)) # carriage return moves cursor to start of line and overwrites text
+                flush() # update the display immediately (no newline, so the line would otherwise stay buffered)
+        except KeyboardInterrupt: # Ctrl+C stops the timer right away
+            print(f"\n\n⏹️  {label} stopped early.")
+            return False
         
         print(f"\n\n✅ {label} complete!")
         return True
     
+    def _itimer_ticks(self, duration):
+        """Yield seconds remaining, woken once per second by a kernel interval timer (POSIX)"""
+        # Block SIGALRM/SIGINT and collect them with sigtimedwait(), so a tick or Ctrl+C that
+        # arrives while we're printing stays pending instead of being missed
+        wake_signals = {signal.SIGALRM, signal.SIGINT}
+        # The blocking only covers this thread, and the timer signals the whole process - if another
+        # thread (e.g. the TTS driver) catches a tick, SIGALRM's default action would kill the program.
+        # A do-nothing handler makes a stray tick harmless.
+        previous_handler = signal.signal(signal.SIGALRM, lambda signum, frame: None)
+        signal.pthread_sigmask(signal.SIG_BLOCK, wake_signals)
+        signal.setitimer(signal.ITIMER_REAL, 1.0, 1.0) # the kernel keeps time, so there's no drift
+        try:
+            for elapsed in range(duration):
+                yield duration - elapsed - 1
+                # sleep until the next tick; Ctrl+C wakes us immediately instead of after the tick.
+                # The timeout keeps the countdown going if a tick went to another thread.
+                info = signal.sigtimedwait(wake_signals, 1.5) # None on timeout
+                if info is not None and info.si_signo == signal.SIGINT:
+                    raise KeyboardInterrupt
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0) # stop the timer
+            if signal.SIGALRM in signal.sigpending():
+                signal.sigwait({signal.SIGALRM}) # drop a leftover tick
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, wake_signals)
+            signal.signal(signal.SIGALRM, previous_handler)
+    
+    def _sleep_ticks(self, duration):
+        """Yield seconds remaining, sleeping until each whole-second boundary"""
+        start = time.perf_counter() # monotonic clock, unaffected by system clock changes
+        end_time = start + duration # when timer should end
+        next_tick = start # when the display should next update
+        
+        while True: # keep looping until time is up
+            now = time.perf_counter()
+            if now >= end_time:
+                break
+            yield int(end_time - now) # seconds left
+            
+            # Sleep until the next whole-second boundary instead of a flat sleep(1),
+            # so time spent printing doesn't add up to drift over 25 minutes
+            next_tick += 1
+            if next_tick < end_time:
+                self._sleep_until(next_tick)
+            else:
+                self._sleep_until(end_time, precise=True) # last tick: hit the end exactly
+    
+    def _sleep_until(self, deadline, precise=False):
+        """Sleep until the given time.perf_counter() deadline"""
+        remaining = deadline - time.perf_counter()
+        if precise and platform.system() == 'Windows':
+            # Windows sleep granularity is ~15ms, so sleep short and spin the last bit
+            if remaining > 0.02:
+                time.sleep(remaining - 0.02)
+            while time.perf_counter() < deadline:
+                pass
+        elif remaining > 0:
+            time.sleep(remaining) # precise enough on Mac/Linux and for display updates
+    
     def start_session(self, task_name):
         """Start a new Pomodoro session"""
         # Ask for sound preference if not set yet
@@ -188,29 +455,31 @@ class PomodoroTimer:
             self.play_sound('complete')
             
             # Log the session and create session record
+            now = datetime.now() # read the clock once so date and time match
             session = {
                 'task': task_name,
-                'date': datetime.now().strftime('%Y-%m-%d'), # format date as YYYY-MM-DD
-                'time': datetime.now().strftime('%H:%M:%S'), # format time as HH:MM:SS
+                'date': now.strftime(_DATE_FMT), # format date as YYYY-MM-DD
+                'time': now.strftime(_TIME_FMT), # format time as HH:MM:SS
                 'duration': self.work_duration // 60,
                 'completed': True
             }
-            self.sessions.append(session) # add to list of sessions
-            self.save_sessions() # save to file
+            self._add_session(session) # add to in-memory history
+            self.save_sessions(session) # append to file
             
             print(f"\n🎉 Pomodoro completed! Great work on '{task_name}'!")
             
             # Ask about break
             take_break = input("\n🌴 Take a 5-minute break? (y/n): ").lower()
             if take_break == 'y':
-                self.countdown(self.break_duration, "Break Time")
-                self.play_sound('break_end')  # Sound when break ends
-                print("\n💪 Ready for the next session!")
+                break_completed = self.countdown(self.break_duration, "Break Time")
+                if break_completed:
+                    self.play_sound('break_end')  # Sound when break ends
+                    print("\n💪 Ready for the next session!")
     
     def show_today(self):
         """Show today's completed sessions"""
-        today = datetime.now().strftime('%Y-%m-%d') # get today's date
-        today_sessions = [s for s in self.sessions if s['date'] == today] # filter sessions for today, loops through all sessions and picks only those from today 
+        today = datetime.now().strftime(_DATE_FMT) # get today's date
+        today_sessions = self.sessions.on_date(today) # binary search for today's sessions (no full scan)
         
         if not today_sessions:
             print("\n📅 No sessions completed today yet.")
@@ -234,8 +503,8 @@ class PomodoroTimer:
         """Show recent session history"""
         # if you want to see more than default 10, you can modify limit parameter
         # e.g., timer.show_history(limit=20)
-        # self.sessions[-limit:] = last N sessions from the end of the list
-        # [::-1] reverses the list to show most recent first
+        # reversed() walks the list from the end (most recent first) and
+        # islice() stops after N sessions - no copies of the list are made
         if not self.sessions:
             print("\n📝 No sessions recorded yet.")
             print("Start one with: python pomodoro.py start \"Your task\"")
@@ -244,7 +513,7 @@ class PomodoroTimer:
         print(f"\n📝 Recent Sessions (Last {limit})")
         print("=" * 50)
         
-        recent = self.sessions[-limit:][::-1]  # Last N sessions, reversed
+        recent = itertools.islice(reversed(self.sessions), limit)  # Last N sessions, most recent first
         
         for i, session in enumerate(recent, 1):
             print(f"{i}. {session['task']}")
@@ -264,33 +533,29 @@ class PomodoroTimer:
         print(f"🍅 Total pomodoros: {total_sessions}")
         
         # Total time
-        total_minutes = sum(s['duration'] for s in self.sessions)
+        total_minutes = self._total_minutes # summed as sessions are loaded/added
         hours = total_minutes / 60
         print(f"⏱️  Total focus time: {total_minutes} minutes ({hours:.1f} hours)")
         
-        # Sessions by day
-        days = {}
-        for session in self.sessions:
-            date = session['date']
-            days[date] = days.get(date, 0) + 1 # Count sessions per day
+        # Sessions by day (counted as sessions are loaded/added)
+        days = self._days
         
         print(f"\n📅 Active days: {len(days)}")
         print(f"📈 Average per active day: {total_sessions / len(days):.1f} pomodoros")
         
         # Most productive day
-        # max() finds the day with the most sessions
+        # most_common(1) returns [(date, count)] for the day with the most sessions
         if days:
-            best_day = max(days.items(), key=lambda x: x[1])
-            # lambda x: x[1] means "sort by second item in tuple (the count of sessions)"
-            # items() returns [(date, count), (date, count), ...] 
+            best_day = days.most_common(1)[0]
             print(f"🏆 Most productive day: {best_day[0]} ({best_day[1]} pomodoros)")
         
         # Recent streak
         print("\n🔥 Recent Activity:")
-        recent_days = sorted(days.keys())[-7:]  # Last 7 days with activity
+        recent_days = sorted(days)[-7:]  # Last 7 days with activity
         for day in recent_days:
-            bar = "🍅" * days[day] # multiply string by count
-            print(f"   {day}: {bar} ({days[day]})")
+            count = days[day]
+            bar = _BAR_CACHE[count] if count < len(_BAR_CACHE) else _TOMATO * count # multiply string by count for very busy days
+            print(f"   {day}: {bar} ({count})")
 
 # simple instruction function
 def show_help():
@@ -338,21 +603,25 @@ def main():
             print('Usage: python pomodoro.py start "Your task name"')
             return
         
-        task_name = " ".join(sys.argv[2:]) # join all args after command as task name
+        task_tokens = sys.argv[2:]
+        if len(task_tokens) == 1:
+            task_name = task_tokens[0] # quoted task name - use it as-is, spacing preserved
+        else:
+            task_name = " ".join(task_tokens) # unquoted words - join all args after command as task name
         timer.start_session(task_name) # start the session
+        return
     
-    elif command == "today":
-        timer.show_today()
-    
-    elif command == "history":
-        timer.show_history()
-    
-    elif command == "stats":
-        timer.show_stats()
-    
-    elif command == "help":
-        show_help()
+    # Commands that take no arguments, looked up in a table instead of an if/elif chain
+    dispatch = {
+        "today": timer.show_today,
+        "history": timer.show_history,
+        "stats": timer.show_stats,
+        "help": show_help,
+    }
     
+    handler = dispatch.get(command)
+    if handler:
+        handler()
     else:
         print(f"❌ Unknown command: {command}")
         print("Run 'python pomodoro.py help' for usage information")